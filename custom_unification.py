@@ -6,25 +6,37 @@ will require lowering of a cast to the extension type from other types.
 
 import sys
 
+from llvmlite import ir
+
 from numba.extending import (
     types,
     register_model,
     models,
 )
 
-from numba.core import cgutils
+from numba.np.numpy_support import as_dtype, from_dtype
 from numba.core.errors import TypingError
 from numba.cuda.cudaimpl import registry as cuda_registry
 from numba import cuda
 
+import numpy as np
+
 from colorama import init, Fore, Style
 init()
 
 
 class ExtensionType(types.Type):
     """An extension type parameterized by an underlying value type"""
+
+    # Results of unify() keyed on (value type, other type), shared between all
+    # instances. Type inference can ask for the same unification many times
+    # over, so each pair only goes through Numba's machinery once.
+    _unify_cache = {}
+
     def __init__(self, value):
-        super().__init__(name="Extension")
+        # The name must include the value type, because Numba interns types by
+        # name - otherwise all extension types would be the same instance
+        super().__init__(name=f"Extension({value})")
         self.value = value
 
     # Defined to make debugging a little easier
@@ -54,16 +66,27 @@ class ExtensionType(types.Type):
         #
         # without any complicated / duplicate logic of our own.
 
+        # Reuse the result of a previous unification of the same pair, in
+        # either order, since unification is symmetric. A cached None records
+        # a pair that is known not to unify.
+        key = (self.value, other)
+        cache = ExtensionType._unify_cache
+        if key in cache:
+            return cache[key]
+
         # Try to unify our value type and the other type
         unified = context.unify_pairs(self.value, other)
 
-        # If that unification failed, then there's no way we can unify
-        if unified is None:
-            return None
-
+        # If that unification failed, then there's no way we can unify.
         # Otherwise, the unified type is an extension parameterised by the
         # unified type
-        return ExtensionType(unified)
+        if unified is None:
+            result = None
+        else:
+            result = ExtensionType(unified)
+
+        cache[key] = cache[(other, self.value)] = result
+        return result
 
 
 @register_model(ExtensionType)
@@ -79,9 +102,24 @@ class ExtensionModel(models.StructModel):
 @cuda_registry.lower_cast(types.Any, ExtensionType)
 def cast_primitive_to_extension(context, builder, fromty, toty, val):
     casted = context.cast(builder, val, fromty, toty.value)
-    ext = cgutils.create_struct_proxy(toty)(context, builder)
-    ext.value = casted
-    return ext._getvalue()
+    # The extension struct has only one member, so build its value directly
+    # rather than storing to and loading from a stack slot via a struct proxy
+    ext = ir.Constant(context.get_value_type(toty), ir.Undefined)
+    return builder.insert_value(ext, casted, 0)
+
+
+# Unification of two numeric scalar types follows NumPy's type promotion rules
+# (see Number.unify() in Numba), so the results for every pair of them can be
+# worked out once up front and placed in the unification cache, rather than
+# walking Numba's type lattice during type inference.
+def _precompute_numeric_unifications():
+    for a in types.number_domain:
+        for b in types.number_domain:
+            promoted = from_dtype(np.promote_types(as_dtype(a), as_dtype(b)))
+            ExtensionType._unify_cache[a, b] = ExtensionType(promoted)
+
+
+_precompute_numeric_unifications()
 
 
 # Compilation of this succeeds, because we can unify an int64 and another int64
@@ -153,38 +153,63 @@ class Quaternion_ops(ConcreteTemplate):
     cases = [signature(quaternion_type, quaternion_type, quaternion_type)]
 
 
-@cuda_lower_attr(QuaternionType, 'phi')
-def cuda_quaternion_phi(context, builder, sig, arg):
-    # Computes math.atan(2 * (a * b + c * d) / (a * a - b * b - c * c + d * d))
-    a = builder.extract_value(arg, 0)
-    b = builder.extract_value(arg, 1)
-    c = builder.extract_value(arg, 2)
-    d = builder.extract_value(arg, 3)
+# Signatures of the math functions used by the lowerings below. These don't
+# depend on the call site, so they are constructed once rather than on every
+# lowering of an attribute.
+_float64_unary_sig = signature(types.float64, types.float64)
+_float64_binary_sig = signature(types.float64, types.float64, types.float64)
+
+
+def _quaternion_components(builder, arg):
+    # Extracts the components a, b, c, d of a quaternion value
+    return tuple(builder.extract_value(arg, i) for i in range(4))
 
+
+def _quaternion_squares(builder, arg):
+    # Extracts the components of a quaternion value along with their squares,
+    # which are shared by the phi and psi computations
+    a, b, c, d = _quaternion_components(builder, arg)
     a2 = builder.fmul(a, a)
     b2 = builder.fmul(b, b)
     c2 = builder.fmul(c, c)
     d2 = builder.fmul(d, d)
+    return a, b, c, d, a2, b2, c2, d2
+
+
+def _atan_of_quotient(context, builder, num, den):
+    # Computes math.atan(num / den) without a division, as
+    # math.atan2(num * copysign(1, den), fabs(den)). The sign of den is folded
+    # into num so that the result stays in (-pi/2, pi/2) like math.atan, rather
+    # than covering all four quadrants like math.atan2(num, den) would.
+    fabs_impl = context.get_function(math.fabs, _float64_unary_sig)
+    copysign_impl = context.get_function(math.copysign, _float64_binary_sig)
+    atan2_impl = context.get_function(math.atan2, _float64_binary_sig)
+
+    one = context.get_constant(types.float64, 1.0)
+    sign = copysign_impl(builder, [one, den])
+    y = builder.fmul(num, sign)
+    x = fabs_impl(builder, [den])
+    return atan2_impl(builder, [y, x])
+
+
+@cuda_lower_attr(QuaternionType, 'phi')
+def cuda_quaternion_phi(context, builder, sig, arg):
+    # Computes math.atan(2 * (a * b + c * d) / (a * a - b * b - c * c + d * d))
+    a, b, c, d, a2, b2, c2, d2 = _quaternion_squares(builder, arg)
 
     numerator = builder.fadd(builder.fmul(a, b), builder.fmul(c, d))
     denominator = builder.fadd(builder.fsub(builder.fsub(a2, b2), c2), d2)
 
-    atan_sig = signature(types.float64, types.float64)
-    atan_impl = context.get_function(math.atan, atan_sig)
-    atan_arg = builder.fmul(context.get_constant(types.float64, 2),
-                            builder.fdiv(numerator, denominator))
-    return atan_impl(builder, [atan_arg])
+    two_numerator = builder.fmul(context.get_constant(types.float64, 2),
+                                 numerator)
+    return _atan_of_quotient(context, builder, two_numerator, denominator)
 
 
 @cuda_lower_attr(QuaternionType, 'theta')
 def cuda_quaternion_theta(context, builder, sig, arg):
     # Computes -math.asin(2 * (b * d - a * c))
-    a = builder.extract_value(arg, 0)
-    b = builder.extract_value(arg, 1)
-    c = builder.extract_value(arg, 2)
-    d = builder.extract_value(arg, 3)
-    asin_sig = signature(types.float64, types.float64)
-    asin_impl = context.get_function(math.asin, asin_sig)
+    a, b, c, d = _quaternion_components(builder, arg)
+    asin_impl = context.get_function(math.asin, _float64_unary_sig)
 
     x = builder.fsub(builder.fmul(b, d), builder.fmul(a, c))
     asin_arg = builder.fmul(context.get_constant(types.float64, 2), x)
@@ -195,24 +220,14 @@ def cuda_quaternion_theta(context, builder, sig, arg):
 @cuda_lower_attr(QuaternionType, 'psi')
 def cuda_quaternion_psi(context, builder, sig, arg):
     # Computes math.atan(2 * (a * d + b * c) / (a * a + b * b - c * c - d * d))
-    a = builder.extract_value(arg, 0)
-    b = builder.extract_value(arg, 1)
-    c = builder.extract_value(arg, 2)
-    d = builder.extract_value(arg, 3)
-
-    a2 = builder.fmul(a, a)
-    b2 = builder.fmul(b, b)
-    c2 = builder.fmul(c, c)
-    d2 = builder.fmul(d, d)
+    a, b, c, d, a2, b2, c2, d2 = _quaternion_squares(builder, arg)
 
     numerator = builder.fadd(builder.fmul(a, d), builder.fmul(b, c))
     denominator = builder.fsub(builder.fsub(builder.fadd(a2, b2), c2), d2)
 
-    atan_sig = signature(types.float64, types.float64)
-    atan_impl = context.get_function(math.atan, atan_sig)
-    atan_arg = builder.fmul(context.get_constant(types.float64, 2),
-                            builder.fdiv(numerator, denominator))
-    return atan_impl(builder, [atan_arg])
+    two_numerator = builder.fmul(context.get_constant(types.float64, 2),
+                                 numerator)
+    return _atan_of_quotient(context, builder, two_numerator, denominator)
 
 
 @cuda_lower(operator.add, quaternion_type, quaternion_type)
@@ -228,7 +243,7 @@ def cuda_quaternion_add(context, builder, sig, args):
     return q3._getvalue()
 
 
-@cuda.jit
+@cuda.jit('void(float64[:])')
 def kernel(arr):
     q1 = Quaternion(1.0, 2.0, 9.75, 5.0)
     q2 = Quaternion(3.0, 4.0, 5.0, 6.0)
@@ -242,9 +257,11 @@ def kernel(arr):
     arr[6] = q3.d
 
 
-numba_res = np.zeros(7)
+d_res = cuda.device_array(7)
+
+kernel[1, 1](d_res)
 
-kernel[1, 1](numba_res)
+numba_res = d_res.copy_to_host()
 
 q1 = Quaternion(1, 2, 9.75, 5)
 q2 = Quaternion(3, 4, 5, 6)